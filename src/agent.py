@@ -1,11 +1,19 @@
+import functools
+
 from langchain.agents import create_openai_functions_agent, AgentExecutor
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import RunnableBranch
 
-from .config import SYSTEM_PROMPT
+from .config import (
+    SYSTEM_PROMPT,
+    AGENT_LLM_TAG,
+    MODEL_NAME,
+    FAST_MODEL_NAME,
+    ROUTER_MAX_INPUT_LENGTH,
+    ROUTER_STRONG_KEYWORDS,
+)
 
 from .tools import tools
-from .memory import memory
-from .llm import llm
 
 __all__ = ("create_agent",)
 
@@ -19,25 +27,85 @@ prompt = ChatPromptTemplate.from_messages(
 )
 
 
+def is_simple_query(inputs: dict) -> bool:
+    """
+    Decide whether a turn can be answered by the fast model.
+
+    Args:
+        inputs: Agent inputs with the user message under "input"
+
+    Returns:
+        True for short messages without comparison/recommendation/analysis
+        keywords, False otherwise
+    """
+    text = inputs["input"].lower()
+    return len(text) < ROUTER_MAX_INPUT_LENGTH and not any(
+        keyword in text for keyword in ROUTER_STRONG_KEYWORDS
+    )
+
+
+@functools.cache
+def _build_agent():
+    """
+    Build the routed functions agent once per process.
+
+    Binding tool schemas to the models is the expensive part of agent
+    creation, so it is shared by every AgentExecutor.
+
+    Returns:
+        RunnableBranch choosing between the fast and the strong model agent,
+        or the strong model agent alone if both tiers use the same model
+    """
+    # Imported here: creating the OpenAI client is deferred until an agent
+    # is actually needed
+    from .llm import llm_fast, llm_strong
+
+    strong_agent = create_openai_functions_agent(
+        llm_strong.with_config(tags=[AGENT_LLM_TAG]), tools, prompt
+    )
+    # Same model in both tiers: routing would save nothing
+    if FAST_MODEL_NAME == MODEL_NAME:
+        return strong_agent
+
+    # Both branches share prompt and tools; the route depends only on the
+    # user input, so every step of one turn stays on the same model
+    return RunnableBranch(
+        (
+            is_simple_query,
+            create_openai_functions_agent(
+                llm_fast.with_config(tags=[AGENT_LLM_TAG]), tools, prompt
+            ),
+        ),
+        strong_agent,
+    )
+
+
+@functools.lru_cache(maxsize=2)
 def create_agent(verbose: bool = False):
     """
     Create a cinema expert AI agent with function calling capabilities.
 
+    Repeated calls with the same verbose flag return the same executor,
+    so all of them share one conversation memory.
+
     Args:
         verbose: Enable verbose output to show agent's thinking process
 
     Returns:
         AgentExecutor instance configured with tools, memory, and LLM
     """
-    agent = create_openai_functions_agent(llm, tools, prompt)
+    from .memory import memory
 
     agent_executor = AgentExecutor(
-        agent=agent,
+        agent=_build_agent(),
         tools=tools,
         memory=memory,
         verbose=verbose,
         return_intermediate_steps=True,
         handle_parsing_errors=True,
+        # Call the model through (a)invoke so the LLM cache is consulted;
+        # astream_events still receives tokens via streaming callbacks
+        stream_runnable=False,
     )
 
     return agent_executor
@@ -1,9 +1,16 @@
+import asyncio
 import time
+import httpx
 import requests as r
 from typing import Optional, Dict, Any
-from .config import OMDB_API_URL, OMDB_API_KEY
+from .cache import ToolCache
+from .config import (
+    OMDB_API_URL,
+    OMDB_API_KEY,
+    TOOL_CACHE_TTL,
+)
 
-__all__ = ("call_omdb_api",)
+__all__ = ("call_omdb_api", "call_omdb_api_async", "close_omdb_client")
 
 
 class OMDBAPIError(Exception):
@@ -12,11 +19,84 @@ class OMDBAPIError(Exception):
     pass
 
 
+class _RateLimitError(OMDBAPIError):
+    """OMDB API request limit reached, the request may be retried"""
+
+    pass
+
+
+def _parse_omdb_response(data: dict) -> Optional[Dict[str, Any]]:
+    """
+    Check OMDB API response payload for errors.
+
+    Args:
+        data: Decoded JSON response
+
+    Returns:
+        Response data or None if nothing was found
+
+    Raises:
+        _RateLimitError: If request limit is reached
+        OMDBAPIError: If API returned any other error
+    """
+    # Check if OMDB API returned an error
+    if data.get("Response") == "False":
+        error_message = data.get("Error", "Unknown error")
+
+        # Handle specific error cases
+        if "limit" in error_message.lower() or "quota" in error_message.lower():
+            raise _RateLimitError(error_message)
+
+        if "not found" in error_message.lower():
+            return None
+
+        raise OMDBAPIError(f"OMDB API error: {error_message}")
+
+    return data
+
+
+# Keep-alive connection pool shared by all OMDB calls
+_session = r.Session()
+_adapter = r.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+_session.headers["Accept-Encoding"] = "gzip"
+
+# Async client for the agent's event loop: HTTP/2 (negotiated over TLS)
+# multiplexes concurrent tool calls over one connection
+_aclient = httpx.AsyncClient(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=8),
+    headers={"Accept-Encoding": "gzip"},
+)
+
+
+def _omdb_aliases(params: dict, data: Dict[str, Any]):
+    """
+    Title lookups also answer for the returned Title and IMDb ID, so
+    "the movie inception" followed by "Inception" or get_movie_by_id hits.
+    """
+    if "t" not in params:
+        return []
+    aliases = []
+    if data.get("Title"):
+        aliases.append({**params, "t": data["Title"]})
+    if data.get("imdbID"):
+        aliases.append({"i": data["imdbID"]})
+    return aliases
+
+
+_omdb_cache = ToolCache(name="omdb", ttl=TOOL_CACHE_TTL, aliases=_omdb_aliases)
+
+
+@_omdb_cache
 def call_omdb_api(
     params: dict, max_retries: int = 3, retry_delay: float = 1.0
 ) -> Optional[Dict[str, Any]]:
     """
     Call OMDB API with error handling and retry logic.
+    Responses are cached, see _omdb_cache.
 
     Args:
         params: Dictionary of query parameters for OMDB API
@@ -38,28 +118,16 @@ def call_omdb_api(
 
     for attempt in range(max_retries):
         try:
-            response = r.get(OMDB_API_URL, params=_params, timeout=10)
+            response = _session.get(OMDB_API_URL, params=_params, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
-
-            # Check if OMDB API returned an error
-            if data.get("Response") == "False":
-                error_message = data.get("Error", "Unknown error")
-
-                # Handle specific error cases
-                if "limit" in error_message.lower() or "quota" in error_message.lower():
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (attempt + 1))
-                        continue
-                    raise OMDBAPIError(f"Rate limit exceeded: {error_message}")
+            return _parse_omdb_response(response.json())
 
-                if "not found" in error_message.lower():
-                    return None
-
-                raise OMDBAPIError(f"OMDB API error: {error_message}")
-
-            return data
+        except _RateLimitError as e:
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay * (attempt + 1))
+                continue
+            raise OMDBAPIError(f"Rate limit exceeded: {str(e)}")
 
         except r.exceptions.Timeout:
             if attempt < max_retries - 1:
@@ -74,3 +142,62 @@ def call_omdb_api(
             raise OMDBAPIError(f"Network error: {str(e)}")
 
     raise OMDBAPIError("Failed to connect to OMDB API after multiple retries")
+
+
+@_omdb_cache
+async def call_omdb_api_async(
+    params: dict, max_retries: int = 3, retry_delay: float = 1.0
+) -> Optional[Dict[str, Any]]:
+    """
+    Async version of call_omdb_api over a shared HTTP/2 client.
+    Shares the response cache with call_omdb_api.
+
+    Args:
+        params: Dictionary of query parameters for OMDB API
+        max_retries: Maximum number of retry attempts for rate limiting
+        retry_delay: Delay in seconds between retries
+
+    Returns:
+        JSON response from OMDB API or None if request failed
+
+    Raises:
+        OMDBAPIError: If API returns an error or request fails after retries
+    """
+    if not OMDB_API_KEY:
+        raise OMDBAPIError(
+            "OMDB API key is not configured. Please set OMDB_API_KEY in .env file"
+        )
+
+    _params = {"apikey": OMDB_API_KEY, **params}
+
+    for attempt in range(max_retries):
+        try:
+            response = await _aclient.get(OMDB_API_URL, params=_params)
+            response.raise_for_status()
+
+            return _parse_omdb_response(response.json())
+
+        except _RateLimitError as e:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay * (attempt + 1))
+                continue
+            raise OMDBAPIError(f"Rate limit exceeded: {str(e)}")
+
+        except httpx.TimeoutException:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay)
+                continue
+            raise OMDBAPIError("Request timeout: OMDB API did not respond in time")
+
+        except (httpx.HTTPError, ValueError) as e:
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay)
+                continue
+            raise OMDBAPIError(f"Network error: {str(e)}")
+
+    raise OMDBAPIError("Failed to connect to OMDB API after multiple retries")
+
+
+async def close_omdb_client() -> None:
+    """Close connections of the async OMDB API client."""
+    await _aclient.aclose()
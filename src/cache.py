@@ -0,0 +1,126 @@
+import inspect
+import json
+import re
+import threading
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+from cachetools import TTLCache
+
+__all__ = ("ToolCache",)
+
+_MISS = object()
+
+
+def _normalize_value(value: Any) -> str:
+    """
+    Keep only lowercased word characters so args differing in case,
+    whitespace or punctuation ("Inception", "inception!") share a key.
+    """
+    return " ".join(re.findall(r"\w+", str(value).lower()))
+
+
+class ToolCache:
+    """
+    Exact-match LRU cache with TTL (``cachetools.TTLCache``) for tool calls,
+    keyed by normalized call parameters. None ("not found") results are
+    cached too.
+
+    A result can also be stored under alias parameters derived from it, e.g.
+    an OMDB title lookup under the returned Title and IMDb ID, so a later
+    call for the canonical form hits without a request.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        ttl: float = 3600,
+        aliases: Optional[Callable[[dict, Any], Iterable[dict]]] = None,
+    ):
+        """
+        Args:
+            name: Cache namespace, part of every key
+            maxsize: Maximum number of cached entries
+            ttl: Time to live of an entry in seconds
+            aliases: Returns extra call parameters a (non-None) result also
+                answers, called with the original params and the result
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.aliases = aliases
+
+        self._lock = threading.Lock()
+        self._entries: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def make_key(self, params: dict) -> str:
+        """
+        Build a stable cache key from call parameters.
+
+        Args:
+            params: Call parameters
+
+        Returns:
+            Cache key string
+        """
+        normalized = {
+            k: _normalize_value(v) for k, v in params.items() if v is not None
+        }
+        payload = json.dumps(normalized, sort_keys=True, ensure_ascii=False)
+        return f"{self.name}:{payload}"
+
+    def _get(self, key: str) -> Any:
+        with self._lock:
+            return self._entries.get(key, _MISS)
+
+    def _store(self, key: str, params: dict, value: Any) -> None:
+        keys = [key]
+        if value is not None and self.aliases is not None:
+            keys.extend(self.make_key(alias) for alias in self.aliases(params, value))
+        with self._lock:
+            for k in keys:
+                self._entries[k] = value
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Decorate a function (sync or async) whose first argument is a dict of
+        call parameters. Sync and async functions decorated by the same cache
+        share entries.
+
+        Exceptions are not cached; None results are cached without aliases.
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(params: dict, *args, **kwargs):
+                key = self.make_key(params)
+                value = self._get(key)
+                if value is not _MISS:
+                    return value
+
+                value = await func(params, *args, **kwargs)
+                self._store(key, params, value)
+                return value
+
+            async_wrapper.cache = self
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(params: dict, *args, **kwargs):
+            key = self.make_key(params)
+            value = self._get(key)
+            if value is not _MISS:
+                return value
+
+            value = func(params, *args, **kwargs)
+            self._store(key, params, value)
+            return value
+
+        wrapper.cache = self
+        return wrapper
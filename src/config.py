@@ -13,11 +13,44 @@ settings = Dynaconf(
 OPENAI_API_KEY = settings.get("OPENAI_API_KEY")
 MODEL_NAME = settings.get("MODEL_NAME", "gpt-4o-mini")
 TEMPERATURE = settings.get("TEMPERATURE", 0.7)
+# Cheaper deterministic model for short lookup turns, MODEL_NAME/TEMPERATURE
+# are reserved for comparisons, recommendations and other reasoning turns.
+# Routing is skipped when both names are equal (the default): every turn
+# then goes to MODEL_NAME and only memory summarization uses the fast model
+FAST_MODEL_NAME = settings.get("FAST_MODEL_NAME", "gpt-4o-mini")
+ROUTER_MAX_INPUT_LENGTH = settings.get("ROUTER_MAX_INPUT_LENGTH", 120)
+# Lowercase substrings that send a turn to the main model regardless of length
+ROUTER_STRONG_KEYWORDS = tuple(
+    settings.get(
+        "ROUTER_STRONG_KEYWORDS",
+        ["compare", "recommend", "analy", "сравн", "посовет", "рекоменд", "анализ"],
+    )
+)
+# Static prefix of every agent request (followed by tool schemas, then the
+# dynamic chat history and input). OpenAI caches prompt prefixes of 1024+
+# tokens server-side, so any edit here invalidates that cache; never
+# interpolate timestamps, request ids or other per-call data into it
 SYSTEM_PROMPT = settings.get("SYSTEM_PROMPT", "")
-MAX_TOKENS = settings.get("MAX_TOKENS", 300)
+# Conversation length in tokens kept verbatim before older messages
+# are summarized (each summarization is an extra LLM call)
+MEMORY_TOKEN_BUDGET = settings.get("MEMORY_TOKEN_BUDGET", 2000)
+# Completion length limit of the chat model, None keeps the model default
+LLM_MAX_TOKENS = settings.get("LLM_MAX_TOKENS", None)
+
+# Tag of the agent's own LLM runs, used to pick answer tokens out of
+# astream_events (memory summarization runs use the same model untagged)
+AGENT_LLM_TAG = "agent_llm"
 
-OMDB_API_URL = settings.get("OMDB_API_URL", "http://www.omdbapi.com/")
+# LLM response cache: "sqlite" (single process), "redis" (shared) or "none"
+LLM_CACHE = str(settings.get("LLM_CACHE", "sqlite")).lower()
+LLM_CACHE_PATH = str(ROOT_DIR / settings.get("LLM_CACHE_PATH", ".langchain_cache.db"))
+REDIS_URL = settings.get("REDIS_URL", "redis://localhost:6379/0")
+
+OMDB_API_URL = settings.get("OMDB_API_URL", "https://www.omdbapi.com/")
 OMDB_API_KEY = settings.get("OMDB_API_KEY", "")
 CSV_DATASET_PATH = str(
     ROOT_DIR / settings.get("CSV_DATASET_PATH", "data/imdb_top_1000.csv")
 )
+
+# OMDB response cache: exact match by normalized params and returned title
+TOOL_CACHE_TTL = settings.get("TOOL_CACHE_TTL", 3600)
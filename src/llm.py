@@ -1,6 +1,60 @@
+from langchain_core.globals import set_llm_cache
 from langchain_openai import ChatOpenAI
-from src.config import MODEL_NAME, TEMPERATURE, OPENAI_API_KEY
+from src.config import (
+    MODEL_NAME,
+    FAST_MODEL_NAME,
+    TEMPERATURE,
+    LLM_MAX_TOKENS,
+    OPENAI_API_KEY,
+    LLM_CACHE,
+    LLM_CACHE_PATH,
+    REDIS_URL,
+)
+
+
+def create_llm_cache():
+    """
+    Create LangChain LLM cache backend selected by LLM_CACHE setting.
+
+    Cache key is built from the serialized prompt messages and the model
+    parameters (model, temperature, bound tools/functions), so a hit requires
+    an identical (model, messages, temperature, tools) tuple. With non-zero
+    TEMPERATURE the first sampled answer is replayed for repeated prompts.
+
+    Returns:
+        SQLiteCache, RedisCache or None if caching is disabled
+    """
+    if LLM_CACHE == "sqlite":
+        from langchain_community.cache import SQLiteCache
+
+        return SQLiteCache(database_path=LLM_CACHE_PATH)
+
+    if LLM_CACHE == "redis":
+        import redis
+        from langchain_community.cache import RedisCache
+
+        return RedisCache(redis.Redis.from_url(REDIS_URL))
+
+    return None
+
+
+set_llm_cache(create_llm_cache())
+
+# Main model for reasoning-heavy turns
+llm_strong = ChatOpenAI(
+    model=MODEL_NAME,
+    temperature=TEMPERATURE,
+    max_tokens=LLM_MAX_TOKENS,
+    openai_api_key=OPENAI_API_KEY,
+    streaming=True,
+)
 
-llm = ChatOpenAI(
-    model=MODEL_NAME, temperature=TEMPERATURE, openai_api_key=OPENAI_API_KEY
+# Cheap deterministic model for short lookups and memory summarization,
+# temperature=0 also makes its LLM cache hits exact replays
+llm_fast = ChatOpenAI(
+    model=FAST_MODEL_NAME,
+    temperature=0,
+    max_tokens=LLM_MAX_TOKENS,
+    openai_api_key=OPENAI_API_KEY,
+    streaming=True,
 )
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import re
 from rich.console import Console
@@ -5,11 +6,28 @@ from rich.spinner import Spinner
 from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
-from .agent import create_agent
+from .config import AGENT_LLM_TAG
 
 
 console = Console()
 
+# All markdown constructs in one alternation, tried in this order at each position
+MARKDOWN_PATTERN = re.compile(
+    r"\*\*\*(?P<bold_italic>.*?)\*\*\*"  # bold italic ***text***
+    r"|\*\*(?P<bold>.*?)\*\*"  # bold **text**
+    r"|\*(?P<italic>.*?)\*"  # italic *text*
+    r"|^#{1,6}\s+"  # headers ###
+    r"|`(?P<code>.*?)`"  # inline code `code`
+    r"|\[(?P<link>.*?)\]\(.*?\)",  # links [text](url)
+    re.MULTILINE,
+)
+
+
+def _replace_markdown(match: re.Match) -> str:
+    """Keep the inner text of a markdown construct, stripping nested syntax."""
+    inner = match.group(match.lastgroup) if match.lastgroup else ""
+    return MARKDOWN_PATTERN.sub(_replace_markdown, inner) if inner else ""
+
 
 def remove_markdown_syntax(text: str) -> str:
     """
@@ -21,18 +39,7 @@ def remove_markdown_syntax(text: str) -> str:
     Returns:
         Clean text without markdown formatting
     """
-    # Remove bold **text**
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text)
-    # Remove italic *text*
-    text = re.sub(r"\*(.*?)\*", r"\1", text)
-    # Remove headers ###
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-    # Remove inline code `code`
-    text = re.sub(r"`(.*?)`", r"\1", text)
-    # Remove links [text](url)
-    text = re.sub(r"\[(.*?)\]\(.*?\)", r"\1", text)
-
-    return text
+    return MARKDOWN_PATTERN.sub(_replace_markdown, text)
 
 
 def format_output(text: str) -> Text:
@@ -67,6 +74,54 @@ def format_output(text: str) -> Text:
     return formatted
 
 
+def render_answer(text: str) -> Panel:
+    """
+    Render agent answer as a Rich panel.
+
+    Args:
+        text: Agent answer text (may be partial while streaming)
+
+    Returns:
+        Panel with formatted answer
+    """
+    return Panel(
+        format_output(text),
+        title="[bold green]Агент[/bold green]",
+        border_style="green",
+    )
+
+
+async def stream_agent_response(agent, user_input: str, live: Live = None) -> dict:
+    """
+    Run the agent and render answer tokens as they are generated.
+
+    Args:
+        agent: AgentExecutor instance
+        user_input: User question
+        live: Rich Live display to update with partial answer (optional)
+
+    Returns:
+        Final AgentExecutor output dictionary
+    """
+    text = ""
+    response = {}
+
+    async for event in agent.astream_events({"input": user_input}, version="v2"):
+        kind = event["event"]
+
+        if kind == "on_chat_model_stream" and AGENT_LLM_TAG in event["tags"]:
+            # Function call chunks have empty content, only answer text is shown
+            chunk = event["data"]["chunk"].content
+            if chunk and live is not None:
+                text += chunk
+                live.update(render_answer(text))
+
+        elif kind == "on_chain_end" and not event["parent_ids"]:
+            response = event["data"]["output"]
+
+    return response
+
+
 def parse_arguments():
     """
     Parse command line arguments.
@@ -90,6 +145,10 @@ def main():
     console.print("[bold green]🎬 Запуск AI Агента-Киноэксперта...[/bold green]")
 
     try:
+        # Imported here: LangChain, OpenAI client and tools load only
+        # after arguments are parsed
+        from .agent import create_agent
+
         agent = create_agent(verbose=verbose)
         console.print(
             "[bold green]✅ Агент готов! Задавайте вопросы о фильмах (или 'выход' для завершения)[/bold green]\n"
@@ -98,52 +157,62 @@ def main():
         console.print(f"[bold red]❌ Ошибка инициализации агента: {e}[/bold red]")
         return
 
-    while True:
-        try:
-            user_input = console.input("[bold yellow]Вы:[/bold yellow] ")
+    # Single event loop for the whole session: async clients keep their
+    # connections bound to the loop they were created in. Runner cancels the
+    # running turn on Ctrl+C and finalizes leftover tasks on exit
+    with asyncio.Runner() as runner:
+        while True:
+            try:
+                user_input = console.input("[bold yellow]Вы:[/bold yellow] ")
+
+                if user_input.lower() in ["выход", "exit", "quit"]:
+                    console.print("\n[bold blue]👋 До встречи![/bold blue]")
+                    break
+
+                if not user_input.strip():
+                    continue
+
+                # Show loading animation until the first token, then stream the
+                # answer. A low refresh rate keeps redraws from competing with
+                # the network-bound agent turn; tokens are shown at the next redraw
+                with Live(
+                    Spinner("dots", text="[cyan]Обрабатываю запрос...[/cyan]"),
+                    console=console,
+                    refresh_per_second=4,
+                    transient=True,
+                ) as live:
+                    # In verbose mode agent logs go to stdout, keep the spinner only
+                    response = runner.run(
+                        stream_agent_response(
+                            agent, user_input, None if verbose else live
+                        )
+                    )
+
+                # Format and display output
+                output = response.get("output", "Нет ответа")
+
+                if verbose:
+                    # In verbose mode, show raw output
+                    console.print(f"\n[bold green]Агент:[/bold green] {output}\n")
+                else:
+                    # Replace the streamed preview (cropped to terminal height)
+                    # with the full formatted output
+                    console.print(render_answer(output))
+                    console.print()
 
-            if user_input.lower() in ["выход", "exit", "quit"]:
+            except KeyboardInterrupt:
                 console.print("\n[bold blue]👋 До встречи![/bold blue]")
                 break
+            except Exception as e:
+                console.print(f"[bold red]❌ Ошибка: {e}[/bold red]\n")
+                if verbose:
+                    import traceback
 
-            if not user_input.strip():
-                continue
+                    console.print("[dim]" + traceback.format_exc() + "[/dim]")
 
-            # Show loading animation
-            with Live(
-                Spinner("dots", text="[cyan]Обрабатываю запрос...[/cyan]"),
-                console=console,
-                refresh_per_second=10,
-            ):
-                response = agent.invoke({"input": user_input})
+        from .api import close_omdb_client
 
-            # Format and display output
-            output = response.get("output", "Нет ответа")
-
-            if verbose:
-                # In verbose mode, show raw output
-                console.print(f"\n[bold green]Агент:[/bold green] {output}\n")
-            else:
-                # In normal mode, show formatted output without markdown
-                formatted_output = format_output(output)
-                console.print(
-                    Panel(
-                        formatted_output,
-                        title="[bold green]Агент[/bold green]",
-                        border_style="green",
-                    )
-                )
-                console.print()
-
-        except KeyboardInterrupt:
-            console.print("\n[bold blue]👋 До встречи![/bold blue]")
-            break
-        except Exception as e:
-            console.print(f"[bold red]❌ Ошибка: {e}[/bold red]\n")
-            if verbose:
-                import traceback
-
-                console.print("[dim]" + traceback.format_exc() + "[/dim]")
+        runner.run(close_omdb_client())
 
 
 if __name__ == "__main__":
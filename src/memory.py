@@ -1,11 +1,11 @@
 from langchain.memory import ConversationSummaryBufferMemory
-from .llm import llm
-from .config import MAX_TOKENS
+from .llm import llm_fast
+from .config import MEMORY_TOKEN_BUDGET
 
 memory = ConversationSummaryBufferMemory(
-    llm=llm,
+    llm=llm_fast,
     memory_key="chat_history",
     return_messages=True,
     output_key="output",
-    max_token_limit=MAX_TOKENS,
+    max_token_limit=MEMORY_TOKEN_BUDGET,
 )
@@ -1,17 +1,150 @@
-from langchain.tools import tool
-from typing import Optional
-import pandas as pd
-from .api import call_omdb_api, OMDBAPIError
+import asyncio
+import functools
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from langchain.tools import tool, StructuredTool
+from typing import Optional, TYPE_CHECKING
+from .api import call_omdb_api, call_omdb_api_async, OMDBAPIError
 from .config import CSV_DATASET_PATH
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 __all__ = ("tools",)
 
-try:
-    df = pd.read_csv(CSV_DATASET_PATH)
-except Exception as e:
-    print(f"Warning: Could not load CSV dataset: {e}")
-    df = None
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORICAL_COLUMNS = ("Genre", "Director", "Star1", "Star2", "Star3", "Star4")
+
+
+def load_dataset(csv_path: str) -> "pd.DataFrame":
+    """
+    Load IMDb Top 1000 dataset, caching the parsed DataFrame as a pickle
+    next to the CSV file. The cache is rebuilt when the CSV is newer.
+
+    Args:
+        csv_path: Path to CSV dataset
+
+    Returns:
+        DataFrame with categorical text columns
+    """
+    import pandas as pd
+
+    cache_path = os.path.splitext(csv_path)[0] + ".pkl"
+    cache_fresh = os.path.exists(cache_path) and (
+        os.path.getmtime(cache_path) >= os.path.getmtime(csv_path)
+    )
+
+    if cache_fresh:
+        try:
+            return pd.read_pickle(cache_path)
+        except Exception:
+            pass  # Stale or incompatible pickle, rebuild it from CSV
+
+    data = pd.read_csv(csv_path)
+    for column in CATEGORICAL_COLUMNS:
+        data[column] = data[column].astype("category")
+
+    try:
+        data.to_pickle(cache_path)
+    except OSError:
+        pass  # Read-only data directory, parse CSV on next start
+
+    return data
+
+
+@functools.cache
+def _get_df() -> Optional["pd.DataFrame"]:
+    """
+    Load the dataset on first use, so importing tools does not pay for pandas.
+
+    Returns:
+        DataFrame or None if dataset could not be loaded
+    """
+    try:
+        return load_dataset(CSV_DATASET_PATH)
+    except Exception as e:
+        print(f"Warning: Could not load CSV dataset: {e}")
+        return None
+
+
+@functools.cache
+def _get_search_index() -> dict:
+    """
+    Build lowercased search columns and genre index once instead of per call.
+    Must be called only when _get_df() returned a DataFrame.
+
+    Returns:
+        Dictionary with "director", "genre", "stars" lowercased Series,
+        "titles" (list of titles in dataset order), "normalized_titles"
+        (the same titles lowercased, punctuation replaced by single spaces),
+        "rating_order" (row labels sorted by rating, stable so ties keep
+        dataset order) and "genre_index" (genre token -> ascending positions
+        in rating_order)
+    """
+    df = _get_df()
+    titles = df["Series_Title"].tolist()
+
+    # .str on a categorical works on categories and returns plain strings
+    genre_lower = df["Genre"].str.lower().fillna("")
+    stars_lower = (
+        df["Star1"].str.lower().fillna("")
+        + "|"
+        + df["Star2"].str.lower().fillna("")
+        + "|"
+        + df["Star3"].str.lower().fillna("")
+        + "|"
+        + df["Star4"].str.lower().fillna("")
+    )
+
+    rating_order = df["IMDB_Rating"].sort_values(ascending=False, kind="stable").index
+    genre_index = defaultdict(list)
+    for rank, genres in enumerate(genre_lower[rating_order]):
+        for genre_token in genres.split(","):
+            genre_index[genre_token.strip()].append(rank)
+
+    return {
+        "director": df["Director"].str.lower().fillna(""),
+        "genre": genre_lower,
+        "stars": stars_lower,
+        "titles": titles,
+        "normalized_titles": [_normalize_title(t) for t in titles],
+        "rating_order": rating_order,
+        "genre_index": dict(genre_index),
+    }
+
+
+# Worker pool for tools that fan out several OMDB requests at once
+_omdb_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="omdb")
+
+
+# OMDB API response fields, missing ones are rendered as N/A
+MOVIE_INFO_TEMPLATE = """Название: {Title}
+Год: {Year}
+Рейтинг: {Rated}
+Дата выхода: {Released}
+Длительность: {Runtime}
+Жанр: {Genre}
+Режиссер: {Director}
+Актеры: {Actors}
+Описание: {Plot}
+Язык: {Language}
+Страна: {Country}
+Награды: {Awards}
+IMDb рейтинг: {imdbRating}/10 ({imdbVotes} голосов)"""
+
+# Sections of compare_two_movies: (label, OMDB API field, value suffix)
+COMPARISON_FIELDS = (
+    ("Год выпуска", "Year", ""),
+    ("Жанр", "Genre", ""),
+    ("Режиссер", "Director", ""),
+    ("IMDb рейтинг", "imdbRating", "/10"),
+    ("Длительность", "Runtime", ""),
+    ("Актеры", "Actors", ""),
+    ("Награды", "Awards", ""),
+)
 
 
 def format_movie_info(movie_data: dict) -> str:
@@ -24,34 +157,7 @@ def format_movie_info(movie_data: dict) -> str:
     Returns:
         Formatted string with movie information
     """
-    title = movie_data.get("Title", "N/A")
-    year = movie_data.get("Year", "N/A")
-    rated = movie_data.get("Rated", "N/A")
-    released = movie_data.get("Released", "N/A")
-    runtime = movie_data.get("Runtime", "N/A")
-    genre = movie_data.get("Genre", "N/A")
-    director = movie_data.get("Director", "N/A")
-    actors = movie_data.get("Actors", "N/A")
-    plot = movie_data.get("Plot", "N/A")
-    language = movie_data.get("Language", "N/A")
-    country = movie_data.get("Country", "N/A")
-    awards = movie_data.get("Awards", "N/A")
-    imdb_rating = movie_data.get("imdbRating", "N/A")
-    imdb_votes = movie_data.get("imdbVotes", "N/A")
-
-    return f"""Название: {title}
-Год: {year}
-Рейтинг: {rated}
-Дата выхода: {released}
-Длительность: {runtime}
-Жанр: {genre}
-Режиссер: {director}
-Актеры: {actors}
-Описание: {plot}
-Язык: {language}
-Страна: {country}
-Награды: {awards}
-IMDb рейтинг: {imdb_rating}/10 ({imdb_votes} голосов)"""
+    return MOVIE_INFO_TEMPLATE.format_map(defaultdict(lambda: "N/A", movie_data))
 
 
 def format_movie_from_csv(movie_row) -> str:
@@ -75,7 +181,242 @@ def format_movie_from_csv(movie_row) -> str:
 (Источник: IMDb Top 1000 локальный датасет)"""
 
 
-@tool
+def format_movie_lines(movies) -> list:
+    """
+    Format dataset rows as "Title (Year) - Rating/10" lines.
+
+    Args:
+        movies: pandas DataFrame with movies from CSV dataset
+
+    Returns:
+        List of formatted lines, one per movie
+    """
+    return [
+        f"{title} ({year}) - {rating}/10"
+        for title, year, rating in zip(
+            movies["Series_Title"].tolist(),
+            movies["Released_Year"].tolist(),
+            movies["IMDB_Rating"].tolist(),
+        )
+    ]
+
+
+def tool_with_async(coroutine):
+    """
+    Like @tool, but also registers an async implementation used when the
+    agent runs on the event loop (AgentExecutor.astream_events).
+
+    Args:
+        coroutine: Async function with the same signature as the decorated one
+
+    Returns:
+        Decorator creating a StructuredTool from the sync function
+    """
+
+    def decorator(func):
+        return StructuredTool.from_function(
+            func=func, coroutine=coroutine, name=func.__name__
+        )
+
+    return decorator
+
+
+# Lone "v" and "x" are left out: in titles they are mostly words or letters
+# ("Ford v Ferrari", "X: First Class", "Malcolm X"), not sequel numbers
+_ROMAN_NUMERALS = frozenset(
+    "ii iii iv vi vii viii ix xi xii xiii xiv xv xvi xvii xviii xix xx".split()
+)
+
+
+def numeral_tokens(text: str) -> frozenset:
+    """
+    Extract sequel markers from a title: digit and roman numeral tokens.
+
+    "Toy Story 2" and "Toy Story 3" differ only in these tokens, which
+    fuzzy scores barely notice, so title matching checks them separately.
+    """
+    return frozenset(
+        token
+        for token in re.findall(r"\w+", text.lower())
+        if token.isdigit() or token in _ROMAN_NUMERALS
+    )
+
+
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and replace punctuation runs with single spaces."""
+    from rapidfuzz import utils
+
+    return " ".join(utils.default_process(title).split())
+
+
+def format_title_result(title: str, result: Optional[dict]) -> str:
+    """
+    Format OMDB API title lookup, falling back to the local dataset.
+
+    Args:
+        title: Requested movie title
+        result: OMDB API response or None if not found or request failed
+
+    Returns:
+        Detailed movie information or not found message
+    """
+    if result is not None:
+        return format_movie_info(result)
+
+    # Fallback to CSV dataset
+    df = _get_df()
+    if df is not None:
+        from rapidfuzz import fuzz, process, utils
+
+        index = _get_search_index()
+        query = _normalize_title(title)
+        # Sequel numbers given in the query must appear in the title:
+        # "Toy Story 5" is not "Toy Story 3", while "Kill Bill" still finds
+        # "Kill Bill: Vol. 1"
+        numerals = numeral_tokens(query)
+
+        def numerals_match(candidate: str) -> bool:
+            return numerals <= numeral_tokens(candidate)
+
+        # Titles containing the query, whole words first ("up" -> "Up", not
+        # "Once Upon a Time in the West"), then any substring
+        if query:
+            for contains in (
+                lambda t: f" {query} " in f" {t} ",
+                lambda t: query in t,
+            ):
+                for position, candidate in enumerate(index["normalized_titles"]):
+                    if contains(candidate) and numerals_match(candidate):
+                        return format_movie_from_csv(df.iloc[position])
+
+        # Otherwise fuzzy matching tolerates typos ("Inceptn"), the result
+        # is a guess and is labeled as such
+        matches = process.extract(
+            title,
+            index["titles"],
+            scorer=fuzz.WRatio,
+            score_cutoff=80,
+            processor=utils.default_process,
+            limit=10,
+        )
+        for match_title, _, position in matches:
+            if numerals_match(match_title):
+                movie_info = format_movie_from_csv(df.iloc[position])
+                return (
+                    f"Точного совпадения для '{title}' нет, ближайший по названию "
+                    f"фильм из локального датасета (нечеткий поиск):\n\n{movie_info}"
+                )
+
+    return f"Фильм '{title}' не найден ни в OMDB API, ни в локальном датасете IMDb Top 1000. Попробуйте использовать search_movies_list для поиска по частичному совпадению."
+
+
+def format_search_results(query: str, result: Optional[dict]) -> str:
+    """
+    Format OMDB API search response for search_movies_list.
+
+    Args:
+        query: Search query
+        result: OMDB API response or None if nothing was found
+
+    Returns:
+        List of found movies or not found message
+    """
+    if result is None or result.get("totalResults") == "0":
+        return f"Фильмы по запросу '{query}' не найдены."
+
+    movies = result.get("Search", [])
+    if not movies:
+        return f"Фильмы по запросу '{query}' не найдены."
+
+    header = f"Найдено {result.get('totalResults', len(movies))} фильмов по запросу '{query}':\n\n"
+    lines = "".join(
+        f"{i}. {movie.get('Title', 'N/A')} ({movie.get('Year', 'N/A')}) - {movie.get('Type', 'N/A')}\n"
+        for i, movie in enumerate(movies[:10], 1)  # Показываем первые 10
+    )
+    footer = "\nИспользуйте search_movie_by_title с точным названием для получения подробной информации."
+    return header + lines + footer
+
+
+def format_comparison(
+    title1: str, title2: str, result1: Optional[dict], result2: Optional[dict]
+) -> str:
+    """
+    Format side-by-side comparison of two OMDB API movies.
+
+    Args:
+        title1: Requested title of the first movie
+        title2: Requested title of the second movie
+        result1: OMDB API response for the first movie or None
+        result2: OMDB API response for the second movie or None
+
+    Returns:
+        Comparison table or not found message
+    """
+    if result1 is None:
+        return f"Первый фильм '{title1}' не найден."
+
+    if result2 is None:
+        return f"Второй фильм '{title2}' не найден."
+
+    movie1 = defaultdict(lambda: "N/A", result1)
+    movie2 = defaultdict(lambda: "N/A", result2)
+    name1, name2 = movie1["Title"], movie2["Title"]
+
+    sections = [f"Сравнение фильмов:\n\nФИЛЬМ 1: {name1}\nФИЛЬМ 2: {name2}"]
+    sections.extend(
+        f"{label}:\n"
+        f"  • {name1}: {movie1[field]}{suffix}\n"
+        f"  • {name2}: {movie2[field]}{suffix}"
+        for label, field, suffix in COMPARISON_FIELDS
+    )
+
+    return "\n\n".join(sections)
+
+
+def format_year_and_type_results(
+    query: str, year: str, movie_type: str, result: Optional[dict]
+) -> str:
+    """
+    Format OMDB API search response for search_movies_by_year_and_type.
+
+    Args:
+        query: Search query
+        year: Requested release year
+        movie_type: Requested media type
+        result: OMDB API response or None if nothing was found
+
+    Returns:
+        List of found movies or not found message
+    """
+    if result is None or result.get("totalResults") == "0":
+        return f"Фильмы по запросу '{query}' ({year}, {movie_type}) не найдены."
+
+    movies = result.get("Search", [])
+    if not movies:
+        return f"Фильмы по запросу '{query}' не найдены."
+
+    header = f"Найдено {result.get('totalResults', len(movies))} фильмов ({year}, {movie_type}):\n\n"
+    return header + "".join(
+        f"{i}. {movie.get('Title', 'N/A')} ({movie.get('Year', 'N/A')})\n"
+        for i, movie in enumerate(movies, 1)
+    )
+
+
+async def _asearch_movie_by_title(title: str, year: Optional[str] = None) -> str:
+    """Async version of search_movie_by_title."""
+    params = {"t": title}
+    if year:
+        params["y"] = year
+
+    try:
+        result = await call_omdb_api_async(params)
+    except OMDBAPIError:
+        result = None  # Fall through to CSV search
+
+    return format_title_result(title, result)
+
+
+@tool_with_async(_asearch_movie_by_title)
 def search_movie_by_title(title: str, year: Optional[str] = None) -> str:
     """
     Поиск подробной информации о фильме по точному названию.
@@ -88,31 +429,32 @@ def search_movie_by_title(title: str, year: Optional[str] = None) -> str:
     Returns:
         Детальная информация о фильме или сообщение об ошибке
     """
+    params = {"t": title}
+    if year:
+        params["y"] = year
+
     # Try OMDB API first
     try:
-        params = {"t": title}
-        if year:
-            params["y"] = year
-
         result = call_omdb_api(params)
+    except OMDBAPIError:
+        result = None  # Fall through to CSV search
 
-        if result is not None:
-            return format_movie_info(result)
+    return format_title_result(title, result)
 
-    except OMDBAPIError as e:
-        pass  # Fall through to CSV search
 
-    # Fallback to CSV dataset
-    if df is not None:
-        result = df[df["Series_Title"].str.contains(title, case=False, na=False)]
-        if not result.empty:
-            movie = result.iloc[0]
-            return format_movie_from_csv(movie)
+async def _asearch_movies_list(query: str, year: Optional[str] = None) -> str:
+    """Async version of search_movies_list."""
+    params = {"s": query}
+    if year:
+        params["y"] = year
 
-    return f"Фильм '{title}' не найден ни в OMDB API, ни в локальном датасете IMDb Top 1000. Попробуйте использовать search_movies_list для поиска по частичному совпадению."
+    try:
+        return format_search_results(query, await call_omdb_api_async(params))
+    except OMDBAPIError as e:
+        return f"Ошибка при поиске фильмов: {str(e)}"
 
 
-@tool
+@tool_with_async(_asearch_movies_list)
 def search_movies_list(query: str, year: Optional[str] = None) -> str:
     """
     Поиск списка фильмов по частичному совпадению названия.
@@ -124,35 +466,28 @@ def search_movies_list(query: str, year: Optional[str] = None) -> str:
     Returns:
         Список найденных фильмов с годом и IMDb ID или сообщение об ошибке
     """
-    try:
-        params = {"s": query}
-        if year:
-            params["y"] = year
-
-        result = call_omdb_api(params)
+    params = {"s": query}
+    if year:
+        params["y"] = year
 
-        if result is None or result.get("totalResults") == "0":
-            return f"Фильмы по запросу '{query}' не найдены."
-
-        movies = result.get("Search", [])
-        if not movies:
-            return f"Фильмы по запросу '{query}' не найдены."
-
-        output = f"Найдено {result.get('totalResults', len(movies))} фильмов по запросу '{query}':\n\n"
-        for i, movie in enumerate(movies[:10], 1):  # Показываем первые 10
-            title = movie.get("Title", "N/A")
-            year = movie.get("Year", "N/A")
-            movie_type = movie.get("Type", "N/A")
-            output += f"{i}. {title} ({year}) - {movie_type}\n"
+    try:
+        return format_search_results(query, call_omdb_api(params))
+    except OMDBAPIError as e:
+        return f"Ошибка при поиске фильмов: {str(e)}"
 
-        output += "\nИспользуйте search_movie_by_title с точным названием для получения подробной информации."
-        return output
 
+async def _acompare_two_movies(title1: str, title2: str) -> str:
+    """Async version of compare_two_movies, both requests run concurrently."""
+    try:
+        result1, result2 = await asyncio.gather(
+            call_omdb_api_async({"t": title1}), call_omdb_api_async({"t": title2})
+        )
+        return format_comparison(title1, title2, result1, result2)
     except OMDBAPIError as e:
-        return f"Ошибка при поиске фильмов: {str(e)}"
+        return f"Ошибка при сравнении фильмов: {str(e)}"
 
 
-@tool
+@tool_with_async(_acompare_two_movies)
 def compare_two_movies(title1: str, title2: str) -> str:
     """
     Сравнение двух фильмов по различным параметрам.
@@ -165,55 +500,28 @@ def compare_two_movies(title1: str, title2: str) -> str:
         Сравнительная таблица характеристик двух фильмов
     """
     try:
-        result1 = call_omdb_api({"t": title1})
-        result2 = call_omdb_api({"t": title2})
-
-        if result1 is None:
-            return f"Первый фильм '{title1}' не найден."
-
-        if result2 is None:
-            return f"Второй фильм '{title2}' не найден."
-
-        comparison = f"""Сравнение фильмов:
-
-ФИЛЬМ 1: {result1.get('Title', 'N/A')}
-ФИЛЬМ 2: {result2.get('Title', 'N/A')}
-
-Год выпуска:
-  • {result1.get('Title', 'N/A')}: {result1.get('Year', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Year', 'N/A')}
-
-Жанр:
-  • {result1.get('Title', 'N/A')}: {result1.get('Genre', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Genre', 'N/A')}
-
-Режиссер:
-  • {result1.get('Title', 'N/A')}: {result1.get('Director', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Director', 'N/A')}
-
-IMDb рейтинг:
-  • {result1.get('Title', 'N/A')}: {result1.get('imdbRating', 'N/A')}/10
-  • {result2.get('Title', 'N/A')}: {result2.get('imdbRating', 'N/A')}/10
-
-Длительность:
-  • {result1.get('Title', 'N/A')}: {result1.get('Runtime', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Runtime', 'N/A')}
+        future1 = _omdb_pool.submit(call_omdb_api, {"t": title1})
+        future2 = _omdb_pool.submit(call_omdb_api, {"t": title2})
+        result1, result2 = future1.result(), future2.result()
+        return format_comparison(title1, title2, result1, result2)
+    except OMDBAPIError as e:
+        return f"Ошибка при сравнении фильмов: {str(e)}"
 
-Актеры:
-  • {result1.get('Title', 'N/A')}: {result1.get('Actors', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Actors', 'N/A')}
 
-Награды:
-  • {result1.get('Title', 'N/A')}: {result1.get('Awards', 'N/A')}
-  • {result2.get('Title', 'N/A')}: {result2.get('Awards', 'N/A')}"""
+async def _aget_movie_by_id(imdb_id: str) -> str:
+    """Async version of get_movie_by_id."""
+    try:
+        result = await call_omdb_api_async({"i": imdb_id})
+    except OMDBAPIError as e:
+        return f"Ошибка при получении информации о фильме: {str(e)}"
 
-        return comparison
+    if result is None:
+        return f"Фильм с ID '{imdb_id}' не найден."
 
-    except OMDBAPIError as e:
-        return f"Ошибка при сравнении фильмов: {str(e)}"
+    return format_movie_info(result)
 
 
-@tool
+@tool_with_async(_aget_movie_by_id)
 def get_movie_by_id(imdb_id: str) -> str:
     """
     Получить информацию о фильме по IMDb ID.
@@ -226,17 +534,29 @@ def get_movie_by_id(imdb_id: str) -> str:
     """
     try:
         result = call_omdb_api({"i": imdb_id})
+    except OMDBAPIError as e:
+        return f"Ошибка при получении информации о фильме: {str(e)}"
 
-        if result is None:
-            return f"Фильм с ID '{imdb_id}' не найден."
+    if result is None:
+        return f"Фильм с ID '{imdb_id}' не найден."
+
+    return format_movie_info(result)
 
-        return format_movie_info(result)
 
+async def _asearch_movies_by_year_and_type(
+    query: str, year: str, movie_type: str = "movie"
+) -> str:
+    """Async version of search_movies_by_year_and_type."""
+    params = {"s": query, "y": year, "type": movie_type}
+
+    try:
+        result = await call_omdb_api_async(params)
+        return format_year_and_type_results(query, year, movie_type, result)
     except OMDBAPIError as e:
-        return f"Ошибка при получении информации о фильме: {str(e)}"
+        return f"Ошибка при поиске: {str(e)}"
 
 
-@tool
+@tool_with_async(_asearch_movies_by_year_and_type)
 def search_movies_by_year_and_type(
     query: str, year: str, movie_type: str = "movie"
 ) -> str:
@@ -251,26 +571,11 @@ def search_movies_by_year_and_type(
     Returns:
         Список найденных фильмов
     """
-    try:
-        params = {"s": query, "y": year, "type": movie_type}
+    params = {"s": query, "y": year, "type": movie_type}
 
+    try:
         result = call_omdb_api(params)
-
-        if result is None or result.get("totalResults") == "0":
-            return f"Фильмы по запросу '{query}' ({year}, {movie_type}) не найдены."
-
-        movies = result.get("Search", [])
-        if not movies:
-            return f"Фильмы по запросу '{query}' не найдены."
-
-        output = f"Найдено {result.get('totalResults', len(movies))} фильмов ({year}, {movie_type}):\n\n"
-        for i, movie in enumerate(movies, 1):
-            title = movie.get("Title", "N/A")
-            year = movie.get("Year", "N/A")
-            output += f"{i}. {title} ({year})\n"
-
-        return output
-
+        return format_year_and_type_results(query, year, movie_type, result)
     except OMDBAPIError as e:
         return f"Ошибка при поиске: {str(e)}"
 
@@ -288,21 +593,29 @@ def get_top_movies_by_genre(genre: str, limit: int = 5) -> str:
     Returns:
         Список топ фильмов указанного жанра с рейтингами
     """
+    df = _get_df()
     if df is None:
         return "Локальный датасет IMDb Top 1000 недоступен."
 
-    filtered = df[df["Genre"].str.contains(genre, case=False, na=False)]
+    index = _get_search_index()
+    genre_index = index["genre_index"]
+    genre_lower = genre.lower()
+    tokens = [token for token in genre_index if genre_lower in token]
 
-    if filtered.empty:
-        return f"Фильмы жанра '{genre}' не найдены в датасете."
+    if tokens:
+        # Substring of a genre token: merge precomputed rating-ordered lists
+        ranks = sorted(set().union(*(genre_index[token] for token in tokens)))
+        top_movies = df.loc[index["rating_order"][ranks[:limit]]]
+    else:
+        filtered = df[index["genre"].str.contains(genre_lower, regex=False)]
 
-    top_movies = filtered.nlargest(limit, "IMDB_Rating")
+        if filtered.empty:
+            return f"Фильмы жанра '{genre}' не найдены в датасете."
 
-    result = f"Топ-{limit} фильмов жанра {genre} (из IMDb Top 1000):\n\n"
-    for idx, movie in top_movies.iterrows():
-        result += f"{movie['Series_Title']} ({movie['Released_Year']}) - {movie['IMDB_Rating']}/10\n"
+        top_movies = filtered.nlargest(limit, "IMDB_Rating")
 
-    return result
+    header = f"Топ-{limit} фильмов жанра {genre} (из IMDb Top 1000):\n\n"
+    return header + "".join(f"{line}\n" for line in format_movie_lines(top_movies))
 
 
 @tool
@@ -316,20 +629,17 @@ def get_movies_by_director(director: str) -> str:
     Returns:
         Список фильмов указанного режиссера с годами и рейтингами
     """
+    df = _get_df()
     if df is None:
         return "Локальный датасет IMDb Top 1000 недоступен."
 
-    result = df[df["Director"].str.contains(director, case=False, na=False)]
+    director_lower = _get_search_index()["director"]
+    result = df[director_lower.str.contains(director.lower(), regex=False)]
 
     if result.empty:
         return f"Фильмы режиссера '{director}' не найдены в датасете IMDb Top 1000."
 
-    movies = "\n".join(
-        [
-            f"{row['Series_Title']} ({row['Released_Year']}) - {row['IMDB_Rating']}/10"
-            for _, row in result.iterrows()
-        ]
-    )
+    movies = "\n".join(format_movie_lines(result))
     return f"Фильмы режиссера {director} (из IMDb Top 1000):\n\n{movies}"
 
 
@@ -344,27 +654,17 @@ def get_movies_by_actor(actor: str) -> str:
     Returns:
         Список фильмов с указанным актером, годами и рейтингами
     """
+    df = _get_df()
     if df is None:
         return "Локальный датасет IMDb Top 1000 недоступен."
 
-    mask = (
-        df["Star1"].str.contains(actor, case=False, na=False)
-        | df["Star2"].str.contains(actor, case=False, na=False)
-        | df["Star3"].str.contains(actor, case=False, na=False)
-        | df["Star4"].str.contains(actor, case=False, na=False)
-    )
-
-    result = df[mask]
+    stars_lower = _get_search_index()["stars"]
+    result = df[stars_lower.str.contains(actor.lower(), regex=False)]
 
     if result.empty:
         return f"Фильмы с актером '{actor}' не найдены в датасете IMDb Top 1000."
 
-    movies = "\n".join(
-        [
-            f"{row['Series_Title']} ({row['Released_Year']}) - {row['IMDB_Rating']}/10"
-            for _, row in result.iterrows()
-        ]
-    )
+    movies = "\n".join(format_movie_lines(result))
     return f"Фильмы с {actor} (из IMDb Top 1000):\n\n{movies}"
 
 
@@ -383,13 +683,17 @@ def get_movies_by_rating(
     Returns:
         Список фильмов с рейтингом не ниже указанного
     """
+    df = _get_df()
     if df is None:
         return "Локальный датасет IMDb Top 1000 недоступен."
 
-    filtered = df[df["IMDB_Rating"] >= min_rating]
+    mask = df["IMDB_Rating"] >= min_rating
 
     if genre:
-        filtered = filtered[filtered["Genre"].str.contains(genre, case=False, na=False)]
+        genre_lower = _get_search_index()["genre"]
+        mask &= genre_lower.str.contains(genre.lower(), regex=False)
+
+    filtered = df[mask]
 
     if filtered.empty:
         genre_text = f" жанра {genre}" if genre else ""
@@ -399,13 +703,16 @@ def get_movies_by_rating(
     top_movies = filtered.nlargest(limit, "IMDB_Rating")
 
     genre_text = f" ({genre})" if genre else ""
-    result = f"Фильмы{genre_text} с рейтингом ≥ {min_rating} (из IMDb Top 1000):\n\n"
-    for _, movie in top_movies.iterrows():
-        result += f"{movie['Series_Title']} ({movie['Released_Year']}) - {movie['IMDB_Rating']}/10\n"
-        result += f"  Жанр: {movie['Genre']}\n"
-        result += f"  Режиссер: {movie['Director']}\n\n"
-
-    return result
+    header = f"Фильмы{genre_text} с рейтингом ≥ {min_rating} (из IMDb Top 1000):\n\n"
+    movies = [
+        f"{line}\n  Жанр: {movie_genre}\n  Режиссер: {director}\n\n"
+        for line, movie_genre, director in zip(
+            format_movie_lines(top_movies),
+            top_movies["Genre"].tolist(),
+            top_movies["Director"].tolist(),
+        )
+    ]
+    return header + "".join(movies)
 
 
 tools = [